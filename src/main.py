@@ -2,6 +2,8 @@
 
 import logging
 
+import numpy as np
+
 from solbot.solana import data
 from solbot.engine import PosteriorEngine, RiskManager
 from solbot.utils import (
@@ -29,8 +31,10 @@ def main() -> None:
     posterior = PosteriorEngine()
     risk = RiskManager()
 
+    # placeholder features are constant, so build the array once rather than
+    # converting a fresh list inside ``predict`` on every slot
+    features = np.ones(posterior.n_features)
     for slot in streamer.stream_slots():
-        features = [1.0] * posterior.n_features
         post = posterior.predict(features)
         print(f"slot {slot}: trend={post.trend:.2f}")
         risk.update_equity(risk.equity + 0.0)  # placeholder for real P&L tracking
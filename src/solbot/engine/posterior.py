@@ -1,6 +1,7 @@
 """Posterior probability engine stubs."""
 
 from dataclasses import dataclass
+import math
 from typing import Sequence
 
 import numpy as np
@@ -24,11 +25,39 @@ class PosteriorEngine:
     def predict(self, x: Sequence[float]) -> PosteriorOutput:
         """Return dummy probabilities based on a linear score."""
         score = float(np.dot(self.coefs, x[: self.n_features]))
-        # simple softmax over three regimes
-        logits = np.array([score, -score, 0.0])
-        exps = np.exp(logits)
-        probs = exps / exps.sum()
-        return PosteriorOutput(rug=0.01, trend=probs[0], revert=probs[1], chop=probs[2])
+        # softmax over the logits (score, -score, 0) on plain floats; numpy
+        # dispatch dominates for three elements. Shifting by |score| keeps
+        # the exponentials from overflowing.
+        shift = abs(score)
+        trend = math.exp(score - shift)
+        revert = math.exp(-score - shift)
+        chop = math.exp(-shift)
+        total = trend + revert + chop
+        return PosteriorOutput(
+            rug=0.01, trend=trend / total, revert=revert / total, chop=chop / total
+        )
+
+    def predict_batch(self, xs: Sequence[Sequence[float]]) -> np.ndarray:
+        """Return an ``(n, 4)`` array of probabilities, one row per input.
+
+        Vectorized equivalent of calling :meth:`predict` on each row of the
+        2-D input; columns follow :class:`PosteriorOutput` field order
+        (rug, trend, revert, chop).
+        """
+        x = np.asarray(xs, dtype=float)
+        if x.ndim == 1 and x.size == 0:
+            x = x.reshape(0, self.n_features)
+        if x.ndim != 2:
+            raise ValueError(f"expected a 2-D batch of feature rows, got {x.ndim}-D")
+        if x.shape[1] < self.n_features:
+            raise ValueError(
+                f"expected at least {self.n_features} features per row, got {x.shape[1]}"
+            )
+        scores = x[:, : self.n_features] @ self.coefs
+        shift = np.abs(scores)
+        exps = np.exp(np.stack((scores - shift, -scores - shift, -shift), axis=1))
+        probs = exps / exps.sum(axis=1, keepdims=True)
+        return np.column_stack((np.full(len(probs), 0.01), probs))
 
     def update(self, x: Sequence[float], y: float, lr: float = 0.01) -> None:
         """Perform a simple gradient step on the logistic regression stub."""
@@ -1,27 +1,44 @@
 """Solana WebSocket event streaming utilities."""
 
 import asyncio
-import json
 import logging
 import contextlib
+import orjson
 import websockets
 
+try:  # optional faster event loop; not available on Windows
+    import uvloop
+except ImportError:  # pragma: no cover - depends on installed extras
+    uvloop = None
+
+# The subscription request never changes, so serialize it once at import.
+SLOT_SUBSCRIBE_MSG = orjson.dumps(
+    {"jsonrpc": "2.0", "id": 1, "method": "slotSubscribe"}
+).decode()
+
 
 class SlotStreamer:
     """Minimal streamer that yields new slot numbers via WebSocket."""
 
-    def __init__(self, rpc_ws_url: str = "wss://api.mainnet-beta.solana.com/"):
+    def __init__(
+        self,
+        rpc_ws_url: str = "wss://api.mainnet-beta.solana.com/",
+        reconnect_delay: float = 1.0,
+    ):
         self.rpc_ws_url = rpc_ws_url
+        self.reconnect_delay = reconnect_delay
 
     async def _subscribe_once(self):
         async with websockets.connect(self.rpc_ws_url) as ws:
-            await ws.send(
-                json.dumps({"jsonrpc": "2.0", "id": 1, "method": "slotSubscribe"})
-            )
+            await ws.send(SLOT_SUBSCRIBE_MSG)
             async for msg in ws:
-                data = json.loads(msg)
-                if "params" in data and "result" in data["params"]:
-                    yield data["params"]["result"]["slot"]
+                try:
+                    slot = orjson.loads(msg)["params"]["result"]["slot"]
+                except (KeyError, TypeError):
+                    # subscription acks, batch arrays and other replies
+                    # carry no slot
+                    continue
+                yield slot
 
     async def _subscribe(self):
         """Yield slots indefinitely, reconnecting on error."""
@@ -31,14 +48,15 @@ class SlotStreamer:
                     yield slot
             except Exception as exc:  # broad catch for connection errors
                 logging.warning("slot stream error: %s; reconnecting", exc)
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.reconnect_delay)
 
     def stream_slots(self):
         """Synchronous generator yielding slots."""
         # ``asyncio.get_event_loop`` is deprecated when no loop is running.
         # Create a dedicated loop for streaming slots to avoid warnings and
-        # ensure compatibility with Python 3.12+.
-        loop = asyncio.new_event_loop()
+        # ensure compatibility with Python 3.12+. ``uvloop`` is used when
+        # installed since the loop does nothing but websocket I/O.
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         queue: asyncio.Queue[int] = asyncio.Queue()
 
@@ -53,7 +71,7 @@ class SlotStreamer:
                 yield slot
         finally:
             task.cancel()
-            with contextlib.suppress(Exception):
+            with contextlib.suppress(asyncio.CancelledError, Exception):
                 loop.run_until_complete(task)
             loop.close()
 
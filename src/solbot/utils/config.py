@@ -26,8 +26,10 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BotConfig:
+    """Immutable runtime configuration shared by all bot components."""
+
     rpc_ws: str
     log_level: str
     wallet: str
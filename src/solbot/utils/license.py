@@ -9,18 +9,21 @@ Replace the constants below with real addresses or set the corresponding
 environment variables at runtime.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 import json
 from cryptography.fernet import Fernet
 from solana.rpc.api import Client
+from solders.message import Message
 from solders.transaction import Transaction
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from spl.token.instructions import (
+    TransferParams,
     transfer,
     get_associated_token_address,
-    create_associated_token_account,
+    create_idempotent_associated_token_account,
 )
 from spl.token.constants import TOKEN_PROGRAM_ID
 
@@ -60,24 +63,38 @@ def load_authority_keypair(path: str | None = None, key: str | None = None) -> K
     return Keypair.from_bytes(bytes(secret))
 
 
+@lru_cache(maxsize=256)
+def _pubkey(address: str) -> Pubkey:
+    """Return ``address`` parsed as a :class:`Pubkey`.
+
+    License checks resolve the same configured mint and wallet addresses on
+    every call, so parsed keys are cached instead of re-decoding the base58
+    string. Addresses returned by RPC calls should not go through this cache.
+    """
+    return Pubkey.from_string(address)
+
+
 @dataclass
 class LicenseManager:
     """Manage license verification and distribution."""
 
     rpc_http: str
+    _rpc: Client | None = field(default=None, init=False, repr=False, compare=False)
 
     def _client(self) -> Client:
-        return Client(self.rpc_http)
+        """Return the RPC client, creating it on first use.
+
+        The client keeps its HTTP session open, so reusing it lets the
+        several requests behind a license check share one connection.
+        """
+        if self._rpc is None:
+            self._rpc = Client(self.rpc_http)
+        return self._rpc
 
     def _has_token(self, wallet: str, mint: str) -> bool:
         """Return ``True`` if ``wallet`` owns at least one token of ``mint``."""
-        client = self._client()
         try:
-            resp = client.get_token_accounts_by_owner(
-                Pubkey.from_string(wallet), {"mint": Pubkey.from_string(mint)}
-            )
-            accounts = resp.get("result", {}).get("value", [])
-            return len(accounts) > 0
+            return len(self.token_accounts(wallet, mint)) > 0
         except Exception:
             return False
 
@@ -85,7 +102,7 @@ class LicenseManager:
         """Return all token accounts for ``wallet`` and ``mint``."""
         client = self._client()
         resp = client.get_token_accounts_by_owner(
-            Pubkey.from_string(wallet), {"mint": Pubkey.from_string(mint)}
+            _pubkey(wallet), {"mint": _pubkey(mint)}
         )
         return resp.get("result", {}).get("value", [])
 
@@ -153,37 +170,34 @@ class LicenseManager:
         if str(keypair.pubkey()) != LICENSE_AUTHORITY:
             raise ValueError("authority mismatch")
 
-        mint = DEMO_MINT if demo else LICENSE_MINT
+        mint = _pubkey(DEMO_MINT if demo else LICENSE_MINT)
+        owner = _pubkey(recipient)
+        authority = keypair.pubkey()
         client = self._client()
 
-        source_token = get_associated_token_address(keypair.pubkey(), Pubkey.from_string(mint))
-        dest_token = get_associated_token_address(Pubkey.from_string(recipient), Pubkey.from_string(mint))
+        source_token = get_associated_token_address(authority, mint)
+        dest_token = get_associated_token_address(owner, mint)
 
-        # Create destination account if required
-        try:
-            acc = client.get_account_info(dest_token)
-            if acc.get("result", {}).get("value") is None:
-                raise Exception
-        except Exception:
-            create_instr = create_associated_token_account(
-                payer=keypair.pubkey(),
-                owner=Pubkey.from_string(recipient),
-                mint=Pubkey.from_string(mint),
-            )
-            tx = Transaction().add(create_instr)
-            client.send_transaction(tx, keypair)
-
-        tx = Transaction().add(
+        # The idempotent create is a no-op when the recipient's token account
+        # already exists, so creation and transfer always share one
+        # transaction without a separate existence check.
+        instructions = [
+            create_idempotent_associated_token_account(
+                payer=authority, owner=owner, mint=mint
+            ),
             transfer(
-                source=source_token,
-                dest=dest_token,
-                owner=keypair.pubkey(),
-                amount=1,
-                program_id=TOKEN_PROGRAM_ID,
-            )
-        )
-        resp = client.send_transaction(tx, keypair)
-        return resp["result"]
+                TransferParams(
+                    program_id=TOKEN_PROGRAM_ID,
+                    source=source_token,
+                    dest=dest_token,
+                    owner=authority,
+                    amount=1,
+                )
+            ),
+        ]
+        blockhash = client.get_latest_blockhash().value.blockhash
+        tx = Transaction([keypair], Message(instructions, authority), blockhash)
+        return str(client.send_transaction(tx).value)
 
     def verify_or_exit(self, wallet: str) -> str:
         """Ensure ``wallet`` has a license, exiting the process if not."""
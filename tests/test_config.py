@@ -1,3 +1,6 @@
+import dataclasses
+
+import pytest
 from solbot.utils import parse_args, BotConfig
 
 
@@ -7,7 +10,26 @@ def test_parse_args_defaults(monkeypatch):
     assert args.rpc_ws.startswith("ws")
 
 
+@pytest.mark.parametrize(
+    "env, attr, value",
+    [
+        ("RPC_WS", "rpc_ws", "wss://env"),
+        ("LOG_LEVEL", "log_level", "DEBUG"),
+        ("WALLET_ADDR", "wallet", "env-wallet"),
+    ],
+)
+def test_parse_args_env_defaults(monkeypatch, env, attr, value):
+    monkeypatch.setenv(env, value)
+    assert getattr(parse_args([]), attr) == value
+
+
 def test_bot_config_from_args():
     ns = parse_args(["--rpc-ws", "wss://custom"]) 
     cfg = BotConfig.from_args(ns)
     assert cfg.rpc_ws == "wss://custom"
+
+
+def test_bot_config_frozen():
+    cfg = BotConfig.from_args(parse_args([]))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.wallet = "other"
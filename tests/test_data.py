@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from solbot.solana import data
 
@@ -5,3 +7,82 @@ from solbot.solana import data
 def test_streamer_init():
     s = data.SlotStreamer()
     assert s.rpc_ws_url.startswith("ws")
+
+
+class FakeSocket:
+    def __init__(self, messages):
+        self.messages = messages
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for msg in self.messages:
+            yield msg
+
+
+def test_subscribe_once_parses_slots(monkeypatch):
+    sock = FakeSocket(
+        [
+            '{"jsonrpc": "2.0", "result": 5, "id": 1}',
+            '[{"jsonrpc": "2.0", "result": 6, "id": 2}]',
+            '{"method": "slotNotification", "params": {"result": {"slot": 42}}}',
+            b'{"method": "slotNotification", "params": {"result": {"slot": 43}}}',
+        ]
+    )
+    monkeypatch.setattr(data.websockets, "connect", lambda url: sock)
+    s = data.SlotStreamer()
+
+    async def collect():
+        return [slot async for slot in s._subscribe_once()]
+
+    assert asyncio.run(collect()) == [42, 43]
+    assert sock.sent == [data.SLOT_SUBSCRIBE_MSG]
+
+
+def test_subscribe_reconnects_after_error(monkeypatch):
+    s = data.SlotStreamer(reconnect_delay=0)
+    attempts = []
+
+    async def flaky():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise ConnectionError("dropped")
+        yield 7
+
+    monkeypatch.setattr(s, "_subscribe_once", flaky)
+
+    async def first_slot():
+        stream = s._subscribe()
+        try:
+            return await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+        finally:
+            await stream.aclose()
+
+    assert asyncio.run(first_slot()) == 7
+    assert len(attempts) == 2
+
+
+def test_stream_slots_without_uvloop(monkeypatch):
+    monkeypatch.setattr(data, "uvloop", None)
+    s = data.SlotStreamer()
+
+    async def fake_once():
+        for slot in (1, 2):
+            yield slot
+        await asyncio.Event().wait()  # idle like an open socket
+
+    monkeypatch.setattr(s, "_subscribe_once", fake_once)
+    stream = s.stream_slots()
+    assert [next(stream), next(stream)] == [1, 2]
+    stream.close()
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 from solbot.engine import PosteriorEngine
 
 
@@ -5,10 +7,49 @@ def test_posterior_predict_shape():
     engine = PosteriorEngine(n_features=3)
     x = [1.0, 2.0, 3.0]
     out = engine.predict(x)
-    assert 0 <= out.trend <= 1
-    assert 0 <= out.revert <= 1
-    assert 0 <= out.chop <= 1
-    assert abs(out.trend + out.revert + out.chop - 1) < 1e-6
+    probs = (out.trend, out.revert, out.chop)
+    for p in probs:
+        assert 0 <= p <= 1
+    assert abs(sum(probs) - 1) < 1e-6
+
+
+def test_posterior_predict_large_score():
+    engine = PosteriorEngine(n_features=2)
+    engine.coefs[:] = 1e3
+    out = engine.predict([1.0, 1.0])
+    assert out.trend == pytest.approx(1.0)
+    assert out.revert == pytest.approx(0.0)
+
+
+def test_posterior_predict_batch_matches_predict():
+    engine = PosteriorEngine(n_features=3)
+    engine.coefs[:] = [0.5, -1.0, 2.0]
+    xs = [[1.0, 2.0, 3.0, 9.0], [0.0, 0.0, 0.0, 9.0], [-4.0, 1.0, -2.0, 9.0]]
+    probs = engine.predict_batch(xs)
+    assert probs.shape == (3, 4)
+    for row, x in zip(probs, xs):
+        out = engine.predict(x)
+        assert row == pytest.approx([out.rug, out.trend, out.revert, out.chop])
+
+
+def test_posterior_predict_batch_empty():
+    assert PosteriorEngine(n_features=3).predict_batch([]).shape == (0, 4)
+
+
+def test_posterior_predict_batch_rejects_flat_row():
+    with pytest.raises(ValueError):
+        PosteriorEngine(n_features=3).predict_batch([1.0, 2.0, 3.0])
+
+
+def test_posterior_predict_batch_rejects_zero_width_rows():
+    engine = PosteriorEngine(n_features=3)
+    with pytest.raises(ValueError):
+        engine.predict([])
+    with pytest.raises(ValueError):
+        engine.predict_batch([[], []])
+    with pytest.raises(ValueError):
+        engine.predict_batch(np.empty((5, 0)))
+
 
 from solbot.engine import RiskManager
 
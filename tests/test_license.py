@@ -7,43 +7,86 @@ from solbot.utils.license import (
     load_authority_keypair,
 )
 from solders.keypair import Keypair
+from solders.hash import Hash
+from solders.rpc.responses import (
+    GetLatestBlockhashResp,
+    RpcBlockhash,
+    RpcResponseContext,
+    SendTransactionResp,
+)
+from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
 from cryptography.fernet import Fernet
 
-class DummyClient:
-    def __init__(self, result):
-        self._result = result
+# syntactically valid base58 addresses shared by the tests below
+VALID_PUBKEY = "11111111111111111111111111111111"
+DEMO_PUBKEY = "1111111QLbz7JHiBTspS962RLKV8GndWFwiEaqKM"
+
+
+@pytest.fixture
+def license_mint(monkeypatch):
+    """Point ``LICENSE_MINT`` at a valid address for the test's duration."""
+    monkeypatch.setattr("solbot.utils.license.LICENSE_MINT", VALID_PUBKEY)
+    return VALID_PUBKEY
+
+
+class MintClient:
+    """Report one token account with ``amount`` tokens for each held mint."""
+
+    def __init__(self, mints, amount=1):
+        self.mints = {Pubkey.from_string(m) for m in mints}
+        self.amount = amount
 
     def get_token_accounts_by_owner(self, owner, opts):
-        return {"result": {"value": self._result}}
+        if opts.get("mint") in self.mints:
+            return {"result": {"value": [{"pubkey": VALID_PUBKEY}]}}
+        return {"result": {"value": []}}
 
+    def get_token_account_balance(self, pubkey):
+        return {"result": {"value": {"amount": str(self.amount)}}}
 
-def test_has_license(monkeypatch):
-    lm = LicenseManager(rpc_http="https://example")
 
-    def fake_client(self):
-        return DummyClient([{"pubkey": "x"}])
+@pytest.fixture
+def manager(monkeypatch):
+    """Return a factory for managers backed by a fake RPC client.
 
-    monkeypatch.setattr(lm, "_client", fake_client.__get__(lm))
-    monkeypatch.setattr("solbot.utils.license.LICENSE_MINT", "11111111111111111111111111111111")
-    assert lm.has_license("11111111111111111111111111111111")
+    ``client`` is used as-is when given; otherwise a :class:`MintClient`
+    holding ``mints`` is created.
+    """
 
+    def make(mints=(), amount=1, client=None):
+        lm = LicenseManager(rpc_http="https://example")
+        client = client or MintClient(mints, amount)
+        monkeypatch.setattr(lm, "_client", lambda: client)
+        return lm
 
-def test_license_mode_demo(monkeypatch):
-    lm = LicenseManager(rpc_http="https://example")
+    return make
+
+
+def test_has_license(manager, license_mint):
+    assert manager((VALID_PUBKEY,)).has_license(VALID_PUBKEY)
+
+
+def test_client_reused(monkeypatch):
+    created = []
 
-    monkeypatch.setattr("solbot.utils.license.LICENSE_MINT", "11111111111111111111111111111111")
+    def counting_client(url):
+        created.append(url)
+        return object()
 
-    demo_mint = "1111111QLbz7JHiBTspS962RLKV8GndWFwiEaqKM"
-    monkeypatch.setattr("solbot.utils.license.DEMO_MINT", demo_mint)
+    monkeypatch.setattr("solbot.utils.license.Client", counting_client)
+    lm = LicenseManager(rpc_http="https://example")
+    assert lm._client() is lm._client()
+    assert created == ["https://example"]
 
-    class DemoClient:
-        def get_token_accounts_by_owner(self, owner, opts):
-            if opts.get("mint") == Pubkey.from_string(demo_mint):
-                return {"result": {"value": ["demo"]}}
-            return {"result": {"value": []}}
 
-    monkeypatch.setattr(lm, "_client", lambda: DemoClient())
-    assert lm.license_mode("11111111111111111111111111111111") == "demo"
+@pytest.mark.parametrize(
+    "held, expected",
+    [((VALID_PUBKEY,), "full"), ((DEMO_PUBKEY,), "demo"), ((), "none")],
+)
+def test_license_mode(monkeypatch, manager, license_mint, held, expected):
+    monkeypatch.setattr("solbot.utils.license.DEMO_MINT", DEMO_PUBKEY)
+    assert manager(held).license_mode(VALID_PUBKEY) == expected
 
 
 def test_verify_or_exit(monkeypatch):
@@ -61,27 +104,15 @@ def test_load_authority_keypair(tmp_path, monkeypatch):
     enc = Fernet(key).encrypt(secret)
     path = tmp_path / "kp.enc"
     path.write_bytes(enc)
-    monkeypatch.setenv("LICENSE_KEYPAIR_PATH", str(path))
-    monkeypatch.setenv("LICENSE_KEYPAIR_KEY", key.decode())
     monkeypatch.setattr("solbot.utils.license.LICENSE_KEYPAIR_PATH", str(path))
     monkeypatch.setattr("solbot.utils.license.LICENSE_KEYPAIR_KEY", key.decode())
     loaded = load_authority_keypair()
     assert loaded.pubkey() == keypair.pubkey()
 
-class BalanceClient:
-    def __init__(self, amount):
-        self.amount = amount
-    def get_token_accounts_by_owner(self, owner, opts):
-        # return a valid 32 byte pubkey string for the dummy token account
-        return {"result": {"value": [{"pubkey": "11111111111111111111111111111111"}]}}
-    def get_token_account_balance(self, pubkey):
-        return {"result": {"value": {"amount": str(self.amount)}}}
 
-def test_license_balance(monkeypatch):
-    lm = LicenseManager(rpc_http="https://example")
-    monkeypatch.setattr(lm, "_client", lambda: BalanceClient(2))
-    monkeypatch.setattr("solbot.utils.license.LICENSE_MINT", "11111111111111111111111111111111")
-    assert lm.license_balance("11111111111111111111111111111111") == 2
+def test_license_balance(manager, license_mint):
+    lm = manager((VALID_PUBKEY,), amount=2)
+    assert lm.license_balance(VALID_PUBKEY) == 2
 
 
 def test_distributor_cli(monkeypatch, capsys):
@@ -98,3 +129,38 @@ def test_distributor_cli(monkeypatch, capsys):
     assert "sig" in out
     assert called["recipient"] == "dest"
     assert called["demo"] is True
+
+
+class SendClient:
+    def __init__(self):
+        self.sent = []
+
+    def get_latest_blockhash(self):
+        return GetLatestBlockhashResp(
+            RpcBlockhash(Hash.default(), 100), RpcResponseContext(1)
+        )
+
+    def send_transaction(self, tx):
+        self.sent.append(tx)
+        return SendTransactionResp(tx.signatures[0])
+
+
+def test_distribute_license_single_transaction(monkeypatch, manager, license_mint):
+    kp = Keypair()
+    monkeypatch.setattr("solbot.utils.license.LICENSE_AUTHORITY", str(kp.pubkey()))
+    client = SendClient()
+
+    sig = manager(client=client).distribute_license(DEMO_PUBKEY, keypair=kp)
+
+    (tx,) = client.sent
+    assert sig == str(tx.signatures[0])
+    tx.verify()
+    msg = tx.message
+    keys = msg.account_keys
+    mint = Pubkey.from_string(VALID_PUBKEY)
+    source = get_associated_token_address(kp.pubkey(), mint)
+    dest = get_associated_token_address(Pubkey.from_string(DEMO_PUBKEY), mint)
+    create_ix, transfer_ix = msg.instructions
+    assert keys[create_ix.program_id_index] == ASSOCIATED_TOKEN_PROGRAM_ID
+    assert keys[transfer_ix.program_id_index] == TOKEN_PROGRAM_ID
+    assert [keys[i] for i in transfer_ix.accounts] == [source, dest, kp.pubkey()]